@@ -1,13 +1,26 @@
 """The Iammeter Modbus Integration."""
 import asyncio
+from functools import partial
+import json
 import logging
+import os
+import re
+import time
 from datetime import timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL, CONF_TYPE
+import homeassistant.util.dt as dt_util
+from homeassistant.util import slugify
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -16,22 +29,59 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusException
 
 from .const import (
+    ATTR_DURATION,
+    ATTR_FILENAME,
+    CONF_ARCHIVE,
+    CONF_MAX_TIMEOUT,
+    CONF_MIN_TIMEOUT,
+    CONF_OPENMETRICS,
+    CONF_REFRESH_WINDOW,
+    CONF_STATISTICS,
+    CONF_TRANSPORT,
+    CONF_TRANSPORT_FILE,
+    DEFAULT_ARCHIVE,
+    DEFAULT_CAPTURE_DURATION,
+    DEFAULT_MAX_TIMEOUT,
+    DEFAULT_MIN_TIMEOUT,
     DEFAULT_NAME,
+    DEFAULT_OPENMETRICS,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_REFRESH_WINDOW,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STATISTICS,
+    DEFAULT_TIMEOUT,
+    DEFAULT_TRANSPORT,
     DEFAULT_TYPE,
     DOMAIN,
+    FILENAME_PATTERN,
+    MAX_CAPTURE_DURATION,
     MAX_OFFLINE_RETRY_INTERVAL,
+    MAX_PROFILE_DURATION,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     OFFLINE_RETRY_INTERVAL,
+    REGISTER_BLOCKS_BY_MODEL,
+    REGISTER_MAP_BY_MODEL,
+    SENSOR_TYPES_BY_MODEL,
+    SERVICE_CAPTURE,
+    SERVICE_PROFILE,
     SUPPORTED_TYPES,
-    TYPE_2067,
-    TYPE_3080,
+    TRANSPORT_LIVE,
+    TRANSPORT_RECORD,
+    TRANSPORT_REPLAY,
 )
+from .archive import IamMeterArchive
+from .decoder import IamMeterSnapshot, build_field_index, decode_registers
+from .openmetrics import IamMeterMetrics, IamMeterOpenMetricsView
+from .profiler import IamMeterProfiler
+from .statistics import IamMeterStatistics
+from .transport import RecordingModbusClient, ReplayModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER_MODBUS_LIB = logging.getLogger("pymodbus.logging")
 _LOGGER_MODBUS_LIB.setLevel(logging.CRITICAL)
+# Views cannot be unregistered, so the endpoint is registered once per run.
+DATA_OPENMETRICS_VIEW = f"{DOMAIN}_openmetrics_view"
 
 IAMMETER_MODBUS_SCHEMA = vol.Schema(
     {
@@ -52,15 +102,128 @@ CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: vol.Schema({cv.slug: IAMMETER_MODBUS_SCHEMA})}, extra=vol.ALLOW_EXTRA
 )
 
+CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_CAPTURE_DURATION): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=0, min_included=False, max=MAX_CAPTURE_DURATION),
+        ),
+        vol.Optional(ATTR_FILENAME): vol.All(
+            cv.string, vol.Match(FILENAME_PATTERN)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=0, min_included=False, max=MAX_PROFILE_DURATION),
+        ),
+    }
+)
+
 PLATFORMS = ["sensor"]
 
 
 async def async_setup(hass, config):
     """Set up the IamMeter modbus component."""
     hass.data[DOMAIN] = {}
+
+    async def async_capture(call: ServiceCall) -> ServiceResponse:
+        """Capture raw register frames from one meter at full speed."""
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        frames = await coordinator.my_api.async_capture(call.data[ATTR_DURATION])
+
+        filename = call.data.get(ATTR_FILENAME)
+        if filename is None and not call.return_response:
+            filename = (
+                f"capture_{slugify(coordinator.my_api.name)}_"
+                f"{dt_util.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+            )
+        if filename is not None:
+            path = hass.config.path(DOMAIN, filename)
+            await hass.async_add_executor_job(_write_capture, path, frames)
+            _LOGGER.info("Wrote %s capture frames to %s", len(frames), path)
+
+        if call.return_response:
+            return {"frames": frames}
+        return None
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CAPTURE,
+        async_capture,
+        schema=CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the poll path of one or all meters for a while."""
+        if ATTR_CONFIG_ENTRY_ID in call.data:
+            coordinators = [
+                _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+            ]
+        else:
+            coordinators = list(hass.data[DOMAIN].values())
+        if any(coordinator.profiler is not None for coordinator in coordinators):
+            raise ServiceValidationError("A profiling run is already active")
+
+        profiler = IamMeterProfiler()
+        for coordinator in coordinators:
+            coordinator.profiler = profiler
+        try:
+            await asyncio.sleep(call.data[ATTR_DURATION])
+        finally:
+            for coordinator in coordinators:
+                coordinator.profiler = None
+
+        path = hass.config.path(
+            DOMAIN, f"profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.pstats"
+        )
+        await hass.async_add_executor_job(_write_profile, path, profiler)
+        _LOGGER.info("Wrote profile of %s meters to %s", len(coordinators), path)
+        if call.return_response:
+            return {"path": path}
+        return None
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     return True
 
 
+def _get_coordinator(hass, entry_id):
+    """Return the coordinator of a loaded config entry."""
+    coordinator = hass.data[DOMAIN].get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(
+            f"No loaded IAMMETER Modbus entry with id {entry_id}"
+        )
+    return coordinator
+
+
+def _write_profile(path, profiler):
+    """Write profiler statistics in pstats format."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    profiler.dump_stats(path)
+
+
+def _write_capture(path, frames):
+    """Write capture frames as JSON lines."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        for frame in frames:
+            file.write(json.dumps(frame))
+            file.write("\n")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     _LOGGER.info("async_setup_entry")
     """Set up a IamMeter mobus."""
@@ -72,20 +235,95 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     _LOGGER.debug("Setup %s.%s", DOMAIN, name)
 
-    hub = IammeterModbusHub(name, host, port, type)
-    coordinator = IamMeterModbusData(hass, hub, scan_interval)
+    statistics = None
+    if entry.options.get(CONF_STATISTICS, DEFAULT_STATISTICS):
+        if "recorder" in hass.config.components:
+            statistics = IamMeterStatistics(
+                hass,
+                name,
+                SENSOR_TYPES_BY_MODEL[type].values(),
+                build_field_index(REGISTER_MAP_BY_MODEL[type]),
+                entry.entry_id,
+            )
+            await statistics.async_restore()
+        else:
+            _LOGGER.warning(
+                "Long-term statistics for %s require the recorder integration",
+                name,
+            )
+
+    transport = entry.options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    transport_path = None
+    if transport != TRANSPORT_LIVE:
+        transport_file = entry.options.get(CONF_TRANSPORT_FILE)
+        if transport_file and not re.match(FILENAME_PATTERN, transport_file):
+            _LOGGER.warning(
+                "Ignoring invalid recording file name %s", transport_file
+            )
+            transport_file = None
+        transport_path = hass.config.path(
+            DOMAIN, transport_file or f"{entry.entry_id}.rec"
+        )
+        _LOGGER.info("Using %s transport with %s", transport, transport_path)
+
+    hub = IammeterModbusHub(
+        name,
+        host,
+        port,
+        type,
+        transport,
+        transport_path,
+        entry.options.get(CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW) / 1000,
+        entry.options.get(CONF_MIN_TIMEOUT, DEFAULT_MIN_TIMEOUT),
+        entry.options.get(CONF_MAX_TIMEOUT, DEFAULT_MAX_TIMEOUT),
+        hass,
+    )
+    archive = None
+    if entry.options.get(CONF_ARCHIVE, DEFAULT_ARCHIVE):
+        archive = IamMeterArchive(
+            hass.config.path(DOMAIN, "archive", entry.entry_id)
+        )
+
+    coordinator = IamMeterModbusData(
+        hass, hub, scan_interval, statistics, archive
+    )
+    if entry.options.get(CONF_OPENMETRICS, DEFAULT_OPENMETRICS):
+        coordinator.metrics = IamMeterMetrics(name, type)
+        if getattr(hass, "http", None) is None:
+            _LOGGER.warning(
+                "OpenMetrics endpoint for %s requires the http integration", name
+            )
+        elif not hass.data.get(DATA_OPENMETRICS_VIEW):
+            hass.http.register_view(IamMeterOpenMetricsView(hass))
+            hass.data[DATA_OPENMETRICS_VIEW] = True
     hass.data[DOMAIN][entry.entry_id] = coordinator
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception:
         hub.close()
+        if archive is not None:
+            archive.close()
         hass.data[DOMAIN].pop(entry.entry_id, None)
         raise
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(
+        entry.add_update_listener(
+            partial(async_reload_entry, options=dict(entry.options))
+        )
+    )
     return True
 
 
+async def async_reload_entry(hass, entry, options):
+    """Reload IamMeter modbus entry when its options change.
+
+    Data updates from the reconfigure step schedule their own reload.
+    """
+    if entry.options != options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass, entry):
     """Unload IamMeter mobus entry."""
     unload_ok = all(
@@ -109,9 +347,19 @@ async def async_unload_entry(hass, entry):
 class IamMeterModbusData(DataUpdateCoordinator):
     """Coordinate polling and offline retry intervals."""
 
-    def __init__(self, hass, my_api, scan_interval):
+    def __init__(
+        self, hass, my_api, scan_interval, statistics=None, archive=None
+    ):
         """Initialize my coordinator."""
         self.my_api = my_api
+        self.statistics = statistics
+        self.archive = archive
+        self._last_refreshed_at = None
+        self.profiler = None
+        self.metrics = None
+        self.polls = 0
+        self.poll_errors = 0
+        self.poll_duration = None
         self._normal_update_interval = timedelta(seconds=scan_interval)
         self._consecutive_failures = 0
         super().__init__(
@@ -121,13 +369,26 @@ class IamMeterModbusData(DataUpdateCoordinator):
             name="IamMeterModbus Data",
             # Polling interval. Will only be polled if there are subscribers.
             update_interval=self._normal_update_interval,
+            # The hub returns the previous snapshot when no register changed,
+            # so unchanged polls are not dispatched to the entities.
+            always_update=False,
         )
 
     async def _async_update_data(self):
+        """Fetch data, profiling the poll while a profiler is attached."""
+        if self.profiler is not None:
+            return await self.profiler.profile(self._async_poll())
+        return await self._async_poll()
+
+    async def _async_poll(self):
         """Fetch data and back off while the meter is offline."""
+        self.polls += 1
+        started = time.monotonic()
         try:
-            data = await self.my_api.async_refresh_modbus_data()
+            data = await self.my_api.async_refresh_modbus_data(self.profiler)
         except (OSError, TimeoutError, ModbusException, ValueError, IndexError) as err:
+            self.poll_errors += 1
+            self.poll_duration = time.monotonic() - started
             self._consecutive_failures = min(self._consecutive_failures + 1, 5)
             retry_interval = min(
                 OFFLINE_RETRY_INTERVAL * 2 ** (self._consecutive_failures - 1),
@@ -139,13 +400,27 @@ class IamMeterModbusData(DataUpdateCoordinator):
                 f"Error communicating with meter: {err}"
             ) from err
 
+        self.poll_duration = time.monotonic() - started
         self._consecutive_failures = 0
         self.update_interval = self._normal_update_interval
+        refreshed_at = self.my_api.refreshed_at
+        if refreshed_at != self._last_refreshed_at:
+            # A new read, not served from the hub's refresh window cache.
+            # Unchanged reads return the previous snapshot but still count.
+            self._last_refreshed_at = refreshed_at
+            if self.statistics is not None:
+                self.statistics.async_add(data)
+            if self.archive is not None:
+                self.archive.append(time.time(), self.my_api.registers)
         return data
 
     async def async_shutdown(self):
         """Stop scheduled updates and close the Modbus connection."""
         await super().async_shutdown()
+        if self.statistics is not None:
+            await self.statistics.async_save()
+        if self.archive is not None:
+            self.archive.close()
         self.my_api.close()
 
 
@@ -158,212 +433,297 @@ class IammeterModbusHub:
         host,
         port,
         type,
+        transport=TRANSPORT_LIVE,
+        transport_path=None,
+        refresh_window=0,
+        min_timeout=DEFAULT_MIN_TIMEOUT,
+        max_timeout=DEFAULT_MAX_TIMEOUT,
+        hass=None,
     ):
         """Initialize the Modbus hub."""
-        self._client = AsyncModbusTcpClient(
-            host=host,
-            port=int(port),
-            timeout=2,
-            retries=0,
-            reconnect_delay=0,
-        )
+        self._hass = hass
+        self._host = host
+        self._port = int(port)
+        self._min_timeout = min_timeout
+        self._max_timeout = max_timeout
+        self._timeout = min(max(DEFAULT_TIMEOUT, min_timeout), max_timeout)
+        self._srtt = None
+        self._rttvar = None
+        if transport == TRANSPORT_RECORD:
+            self._client = RecordingModbusClient(
+                self._create_client(), transport_path
+            )
+        elif transport == TRANSPORT_LIVE:
+            self._client = self._create_client()
+        else:
+            self._client = ReplayModbusClient(
+                transport_path, realtime=transport == TRANSPORT_REPLAY
+            )
         self._value_attr_name = "count"
         self._name = name
         self._type = type
-        self.data = {}
+        self._fields = REGISTER_MAP_BY_MODEL[type]
+        self._field_index = build_field_index(self._fields)
+        self._blocks = REGISTER_BLOCKS_BY_MODEL[type]
+        self._registers = [0] * self._register_count
+        self._block_read_at = [None] * len(self._blocks)
+        self._poll_count = 0
+        self._unchanged_polls = 0
+        self._refresh_window = refresh_window
+        self._refresh = None
+        self._refreshed_at = None
+        self._read_at = None
+        self.data = None
+
+    async def async_refresh_modbus_data(self, profiler=None):
+        """Return fresh meter data, sharing a read that is already in flight.
+
+        Data younger than the refresh window is returned without a read. The
+        read runs in its own task; with ``profiler`` set, its steps are
+        profiled as well.
+        """
+        if self._refresh is None:
+            if (
+                self._refreshed_at is not None
+                and time.monotonic() - self._refreshed_at < self._refresh_window
+            ):
+                return self.data
+            refresh = self._async_refresh()
+            if profiler is not None:
+                refresh = self._async_profiled(profiler, refresh)
+            if self._hass is not None:
+                self._refresh = self._hass.async_create_task(
+                    refresh, f"{DOMAIN} refresh {self._name}"
+                )
+            else:
+                self._refresh = asyncio.ensure_future(refresh)
+            self._refresh.add_done_callback(self._async_refresh_done)
+        # Shielded so a cancelled caller does not abort the shared read.
+        return await asyncio.shield(self._refresh)
 
-    async def async_refresh_modbus_data(self):
+    async def _async_refresh(self):
         """Connect if needed and perform one asynchronous Modbus read."""
         if not self._client.connected and not await self._client.connect():
             raise ConnectionException("Unable to connect to meter")
 
         await self.read_modbus_holding_registers()
+        self._refreshed_at = time.monotonic()
+        self._read_at = time.time()
         return self.data
 
+    @staticmethod
+    async def _async_profiled(profiler, coro):
+        """Run ``coro`` with each of its steps profiled."""
+        return await profiler.profile(coro)
+
+    def _async_refresh_done(self, refresh):
+        """Allow the next refresh to start a new read."""
+        self._refresh = None
+        if not refresh.cancelled():
+            # Mark the error as retrieved when every caller was cancelled.
+            refresh.exception()
+
     @property
     def name(self):
         """Return the name of this hub."""
         return self._name
 
-    def close(self):
-        """Disconnect client."""
-        self._client.close()
-
-    async def read_modbus_holding_registers(self):
-        """Read modbus holding registers with error handling and modern API."""
-        typeCount = 66  # Extended to include all registers up to runtime at 64-65
-        if self._type == TYPE_3080:
-            typeCount = 8
-
-        try:
-            # pymodbus < 3.10.0. Try this first because older releases accept
-            # and silently ignore unknown keyword arguments.
-            resp = await self._client.read_holding_registers(
-                address=0x0,
-                count=typeCount,
-                slave=1,
-            )
-        except TypeError:
-            # pymodbus >= 3.10.0
-            resp = await self._client.read_holding_registers(
-                address=0x0,
-                count=typeCount,
-                device_id=1,
-            )
-
-        if resp.isError():
-            raise ModbusException(f"Modbus read error: {resp}")
-
-        regs = resp.registers
-        if len(regs) < typeCount:
-            raise ModbusException(
-                f"Short Modbus response: expected {typeCount} registers, got {len(regs)}"
-            )
-
-        def u16(i):
-            """Read 16-bit unsigned integer"""
-            return regs[i] & 0xFFFF
-
-        def s32(i):
-            """Read 32-bit signed integer"""
-            value = (regs[i] << 16) | regs[i + 1]
-            return value - 0x100000000 if value & 0x80000000 else value
-
-        def u32(i):
-            """Read 32-bit unsigned integer"""
-            return (regs[i] << 16) | regs[i + 1]
-
-        if self._type == TYPE_3080:
-            voltage_a = u16(0)
-            self.data["voltage_a"] = round(voltage_a * 0.01, 1)
-
-            current_a = u16(1)
-            self.data["current_a"] = round(current_a * 0.01, 1)
-
-            power_a = s32(2)                # 2~3
-            self.data["power_a"] = power_a
-
-            import_energy_a = u32(4)        # 4~5
-            self.data["import_energy_a"] = round(
-                import_energy_a * 0.0003125, 3)
-
-            export_energy_a = u32(6)        # 6~7
-            self.data["export_energy_a"] = round(
-                export_energy_a * 0.0003125, 3)
-            return True
-        else:
-            voltage_a = u16(0)
-            self.data["voltage_a"] = round(voltage_a * 0.01, 1)
-
-            current_a = u16(1)
-            self.data["current_a"] = round(current_a * 0.01, 1)
-
-            power_a = s32(2)                    # 2~3
-            self.data["power_a"] = power_a
-
-            import_energy_a = u32(4)            # 4~5
-            self.data["import_energy_a"] = round(import_energy_a * 0.00125, 2)
-
-            export_energy_a = u32(6)            # 6~7
-            self.data["export_energy_a"] = round(export_energy_a * 0.00125, 2)
-
-            power_factor_a = u16(8)             # 8
-            self.data["power_factor_a"] = round(power_factor_a * 0.001, 2)
-
-            # Skip register 9
-            voltage_b = u16(10)
-            self.data["voltage_b"] = round(voltage_b * 0.01, 1)
-
-            current_b = u16(11)
-            self.data["current_b"] = round(current_b * 0.01, 1)
+    @property
+    def refreshed_at(self):
+        """Return the monotonic time of the last successful read."""
+        return self._refreshed_at
 
-            power_b = s32(12)                   # 12~13
-            self.data["power_b"] = power_b
+    @property
+    def read_at(self):
+        """Return the Unix time of the last successful read."""
+        return self._read_at
 
-            import_energy_b = u32(14)           # 14~15
-            self.data["import_energy_b"] = round(import_energy_b * 0.00125, 2)
+    @property
+    def unchanged_polls(self):
+        """Return how many polls were skipped because no register changed."""
+        return self._unchanged_polls
 
-            export_energy_b = u32(16)           # 16~17
-            self.data["export_energy_b"] = round(export_energy_b * 0.00125, 2)
+    @property
+    def registers(self):
+        """Return the cached holding register image."""
+        return self._registers
 
-            power_factor_b = u16(18)            # 18
-            self.data["power_factor_b"] = round(power_factor_b * 0.001, 2)
+    @property
+    def timeout(self):
+        """Return the current request timeout in seconds."""
+        return self._timeout
 
-            if self._type != TYPE_2067:
-                # Skip register 19
-                voltage_c = u16(20)
-                self.data["voltage_c"] = round(voltage_c * 0.01, 1)
+    @property
+    def field_index(self):
+        """Return the key to snapshot position mapping of this meter."""
+        return self._field_index
 
-                current_c = u16(21)
-                self.data["current_c"] = round(current_c * 0.01, 1)
+    def close(self):
+        """Disconnect client."""
+        self._refreshed_at = None
+        self._client.close()
 
-                power_c = s32(22)                   # 22~23
-                self.data["power_c"] = power_c
+    def _create_client(self):
+        """Create a Modbus TCP client for this meter."""
+        return AsyncModbusTcpClient(
+            host=self._host,
+            port=self._port,
+            # Requests are bounded by the adaptive timeout; this only caps
+            # connects and anything outside it.
+            timeout=self._max_timeout,
+            retries=0,
+            reconnect_delay=0,
+        )
 
-                import_energy_c = u32(24)           # 24~25
-                self.data["import_energy_c"] = round(
-                    import_energy_c * 0.00125, 2
-                )
+    @property
+    def _register_count(self):
+        """Return the number of holding registers covered by the blocks."""
+        return max(block.address + block.count for block in self._blocks)
+
+    def block_ages(self):
+        """Return the seconds since each register block was last read."""
+        now = time.time()
+        return {
+            block.address: None if read_at is None else now - read_at
+            for block, read_at in zip(self._blocks, self._block_read_at)
+        }
+
+    async def async_capture(self, duration):
+        """Read raw register frames back to back for ``duration`` seconds.
+
+        A dedicated connection with the longest timeout is used so the
+        coordinator's client, cadence, request timeout and entity state are
+        left untouched.
+        """
+        client = self._create_client()
+        if not await client.connect():
+            client.close()
+            raise ConnectionException("Unable to connect to meter")
 
-                export_energy_c = u32(26)           # 26~27
-                self.data["export_energy_c"] = round(
-                    export_energy_c * 0.00125, 2
+        count = self._register_count
+        frames = []
+        end = time.monotonic() + duration
+        try:
+            while time.monotonic() < end:
+                timestamp = time.time()
+                started = time.monotonic()
+                try:
+                    regs = await self._async_read_registers(
+                        client, 0, count, adaptive=False
+                    )
+                except (TimeoutError, ModbusException) as err:
+                    frames.append({"time": timestamp, "error": str(err)})
+                    if not client.connected:
+                        break
+                    continue
+                frames.append(
+                    {
+                        "time": timestamp,
+                        "rtt": round(time.monotonic() - started, 6),
+                        "registers": list(regs),
+                    }
                 )
+        finally:
+            client.close()
+        return frames
 
-                power_factor_c = u16(28)            # 28
-                self.data["power_factor_c"] = round(power_factor_c * 0.001, 2)
-
-            # Skip register 29
-            frequency = u16(30)
-            self.data["frequency"] = round(frequency * 0.01, 1)
-
-            # Skip register 31
-            total_power = s32(32)               # 32~33
-            self.data["total_power"] = total_power
-
-            total_import_energy = u32(34)       # 34~35
-            self.data["total_import_energy"] = round(
-                total_import_energy * 0.00125, 2)
-
-            total_export_energy = u32(36)       # 36~37
-            self.data["total_export_energy"] = round(
-                total_export_energy * 0.00125, 2)
-
-            # Reactive power readings
-            reactive_power_a = s32(38)           # 38~39
-            self.data["reactive_power_a"] = reactive_power_a
-
-            inductive_kvarh_a = u32(40)          # 40~41
-            self.data["inductive_kvarh_a"] = round(inductive_kvarh_a / 1000, 3)
+    async def _async_read_registers(self, client, address, count, adaptive=True):
+        """Read ``count`` holding registers starting at ``address``.
 
-            capacitive_kvarh_a = u32(42)         # 42~43
-            self.data["capacitive_kvarh_a"] = round(capacitive_kvarh_a / 1000, 3)
-
-            reactive_power_b = s32(44)           # 44~45
-            self.data["reactive_power_b"] = reactive_power_b
-
-            inductive_kvarh_b = u32(46)          # 46~47
-            self.data["inductive_kvarh_b"] = round(inductive_kvarh_b / 1000, 3)
-
-            capacitive_kvarh_b = u32(48)         # 48~49
-            self.data["capacitive_kvarh_b"] = round(capacitive_kvarh_b / 1000, 3)
+        With ``adaptive`` unset, the longest timeout applies and the request
+        does not change the timeout used for polling.
+        """
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(
+                self._timeout if adaptive else self._max_timeout
+            ):
+                try:
+                    # pymodbus < 3.10.0. Try this first because older releases
+                    # accept and silently ignore unknown keyword arguments.
+                    resp = await client.read_holding_registers(
+                        address=address,
+                        count=count,
+                        slave=1,
+                    )
+                except TypeError:
+                    # pymodbus >= 3.10.0
+                    resp = await client.read_holding_registers(
+                        address=address,
+                        count=count,
+                        device_id=1,
+                    )
+        except TimeoutError:
+            if adaptive:
+                # Back off until a response is measured again.
+                self._timeout = min(self._timeout * 2, self._max_timeout)
+            raise
+        if adaptive:
+            self._update_timeout(time.monotonic() - started)
 
-            if self._type != TYPE_2067:
-                reactive_power_c = s32(50)           # 50~51
-                self.data["reactive_power_c"] = reactive_power_c
+        if resp.isError():
+            raise ModbusException(f"Modbus read error: {resp}")
 
-                inductive_kvarh_c = u32(52)          # 52~53
-                self.data["inductive_kvarh_c"] = round(
-                    inductive_kvarh_c / 1000, 3
-                )
+        regs = resp.registers
+        if len(regs) < count:
+            raise ModbusException(
+                f"Short Modbus response: expected {count} registers, got {len(regs)}"
+            )
+        return regs
 
-                capacitive_kvarh_c = u32(54)         # 54~55
-                self.data["capacitive_kvarh_c"] = round(
-                    capacitive_kvarh_c / 1000, 3
-                )
+    def _update_timeout(self, rtt):
+        """Derive the request timeout from smoothed RTT and its variance.
 
-            # Runtime at address 64
-            runtime = u32(64)                    # 64~65
-            self.data["runtime"] = runtime
+        Uses the TCP retransmission timeout estimator from RFC 6298.
+        """
+        if self._srtt is None:
+            self._srtt = rtt
+            self._rttvar = rtt / 2
+        else:
+            self._rttvar = 0.75 * self._rttvar + 0.25 * abs(self._srtt - rtt)
+            self._srtt = 0.875 * self._srtt + 0.125 * rtt
+        timeout = self._srtt + max(0.01, 4 * self._rttvar)
+        self._timeout = min(max(timeout, self._min_timeout), self._max_timeout)
 
+    async def read_modbus_holding_registers(self):
+        """Read modbus holding registers with error handling and modern API.
+
+        Slow blocks are read on every Nth poll only; their cached registers
+        are decoded in between and :meth:`block_ages` reports how old they are
+        (exported by the OpenMetrics endpoint).
+        When no block changed, the previous snapshot is kept without decoding.
+        The register image and block read times are only replaced once every
+        block was read and decoded, so a failed poll is compared again.
+        """
+        poll = self._poll_count
+        self._poll_count += 1
+        # The image the current snapshot was decoded from.
+        registers = list(self._registers)
+        block_read_at = list(self._block_read_at)
+        changed = self.data is None
+        for index, block in enumerate(self._blocks):
+            if block_read_at[index] is not None and poll % block.period:
+                continue
+            regs = await self._async_read_registers(
+                self._client, block.address, block.count
+            )
+            block_read_at[index] = time.time()
+            end = block.address + block.count
+            regs = list(regs[:block.count])
+            if registers[block.address:end] != regs:
+                registers[block.address:end] = regs
+                changed = True
+
+        if not changed:
+            self._block_read_at = block_read_at
+            self._unchanged_polls += 1
             return True
+
+        self.data = IamMeterSnapshot(
+            decode_registers(self._fields, registers),
+            time.time(),
+            self._field_index,
+        )
+        self._registers = registers
+        self._block_read_at = block_read_at
+        return True
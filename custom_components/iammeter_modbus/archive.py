@@ -0,0 +1,178 @@
+"""Compressed full-resolution archive of IAMMETER register frames.
+
+Frames are stored per meter in daily (UTC) segment files. A segment is a
+sequence of zlib-compressed blocks; each block holds a start time, the
+register count and its frames. Every frame stores its time offset in
+milliseconds, a bitmask of the registers that changed since the previous
+frame and only those register values. The first frame of a block is compared
+against zeros, so every block decodes on its own.
+
+Each block has an entry in the ``.idx`` file next to the segment with its
+first and last frame time, offset, length and frame count, which lets readers
+seek straight to a time range.
+"""
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+
+_LOGGER = logging.getLogger(__name__)
+
+BLOCK_HEADER = struct.Struct("<dH")
+FRAME_OFFSET = struct.Struct("<I")
+INDEX_ENTRY = struct.Struct("<ddQII")
+BLOCK_FRAMES = 600
+BLOCK_SECONDS = 600
+# One worker thread writes the files of all meters. Jobs run in submission
+# order, so each file is still appended in order.
+WRITER = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="iammeter_modbus_writer"
+)
+
+
+def _segment_name(timestamp):
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+def encode_block(frames):
+    """Delta-encode and compress ``(timestamp, registers)`` frames."""
+    start = frames[0][0]
+    count = len(frames[0][1])
+    payload = bytearray(BLOCK_HEADER.pack(start, count))
+    previous = (0,) * count
+    mask_size = (count + 7) // 8
+    for timestamp, registers in frames:
+        mask = bytearray(mask_size)
+        changed = []
+        for position, (value, old) in enumerate(zip(registers, previous)):
+            if value != old:
+                mask[position >> 3] |= 1 << (position & 7)
+                changed.append(value & 0xFFFF)
+        payload += FRAME_OFFSET.pack(round((timestamp - start) * 1000))
+        payload += mask
+        payload += struct.pack(f"<{len(changed)}H", *changed)
+        previous = registers
+    return zlib.compress(bytes(payload))
+
+
+def decode_block(data):
+    """Return the ``(timestamp, registers)`` frames of a compressed block."""
+    payload = zlib.decompress(data)
+    start, count = BLOCK_HEADER.unpack_from(payload)
+    offset = BLOCK_HEADER.size
+    mask_size = (count + 7) // 8
+    registers = [0] * count
+    frames = []
+    while offset < len(payload):
+        (milliseconds,) = FRAME_OFFSET.unpack_from(payload, offset)
+        offset += FRAME_OFFSET.size
+        mask = payload[offset:offset + mask_size]
+        offset += mask_size
+        for position in range(count):
+            if mask[position >> 3] & (1 << (position & 7)):
+                (registers[position],) = struct.unpack_from("<H", payload, offset)
+                offset += 2
+        frames.append((start + milliseconds / 1000, tuple(registers)))
+    return frames
+
+
+class IamMeterArchive:
+    """Append register frames of one meter to daily segment files.
+
+    Frames are buffered on the event loop; encoding, compression and file
+    writes run on the shared :data:`WRITER` thread, which keeps blocks in order.
+    """
+
+    def __init__(self, directory):
+        """Initialize the archive writer."""
+        self._directory = directory
+        self._frames = []
+
+    def append(self, timestamp, registers):
+        """Add one frame, writing out the block when it is complete."""
+        frames = self._frames
+        if frames and (
+            len(frames) >= BLOCK_FRAMES
+            or timestamp - frames[0][0] >= BLOCK_SECONDS
+            or _segment_name(timestamp) != _segment_name(frames[0][0])
+        ):
+            self.flush()
+        self._frames.append((timestamp, tuple(registers)))
+
+    def flush(self):
+        """Write the buffered frames as one block."""
+        if not self._frames:
+            return
+        frames = self._frames
+        self._frames = []
+        WRITER.submit(self._write_block, frames)
+
+    def close(self):
+        """Write the buffered frames."""
+        self.flush()
+
+    def _write_block(self, frames):
+        name = _segment_name(frames[0][0])
+        segment = os.path.join(self._directory, f"{name}.seg")
+        try:
+            block = encode_block(frames)
+            os.makedirs(self._directory, exist_ok=True)
+            with open(segment, "ab") as file:
+                offset = file.tell()
+                file.write(block)
+            with open(f"{segment[:-4]}.idx", "ab") as file:
+                file.write(
+                    INDEX_ENTRY.pack(
+                        frames[0][0], frames[-1][0], offset, len(block), len(frames)
+                    )
+                )
+        except OSError as err:
+            _LOGGER.error("Unable to write archive %s: %s", segment, err)
+
+
+def read_segment(segment, start=None, end=None):
+    """Yield the ``(timestamp, registers)`` frames of a segment in a range.
+
+    The index selects the blocks overlapping ``start``..``end`` (Unix
+    timestamps, inclusive); block data is read from a memory map.
+    """
+    with open(f"{segment[:-4]}.idx", "rb") as file:
+        entries = file.read()
+    # Ignore a partially written last entry.
+    entries = entries[:len(entries) - len(entries) % INDEX_ENTRY.size]
+    index = list(INDEX_ENTRY.iter_unpack(entries))
+    if not index:
+        return
+
+    first = 0
+    if start is not None:
+        # Blocks are appended in time order, so their last times are sorted.
+        first = bisect_left([entry[1] for entry in index], start)
+
+    with open(segment, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        for block_start, _, offset, length, _ in index[first:]:
+            if end is not None and block_start > end:
+                break
+            for timestamp, registers in decode_block(data[offset:offset + length]):
+                if start is not None and timestamp < start:
+                    continue
+                if end is not None and timestamp > end:
+                    break
+                yield timestamp, registers
+
+
+def read_archive(directory, start, end):
+    """Yield the frames of all daily segments in ``directory`` in a range."""
+    day = 86400
+    current = start - start % day
+    while current <= end:
+        segment = os.path.join(directory, f"{_segment_name(current)}.seg")
+        if os.path.exists(segment):
+            yield from read_segment(segment, start, end)
+        current += day
@@ -12,14 +12,34 @@ from homeassistant.core import HomeAssistant, callback
 _LOGGER = logging.getLogger(__name__)
 
 from .const import (
+    CONF_ARCHIVE,
+    CONF_MAX_TIMEOUT,
+    CONF_MIN_TIMEOUT,
+    CONF_OPENMETRICS,
+    CONF_REFRESH_WINDOW,
+    CONF_STATISTICS,
+    CONF_TRANSPORT,
+    CONF_TRANSPORT_FILE,
+    DEFAULT_ARCHIVE,
+    DEFAULT_MAX_TIMEOUT,
+    DEFAULT_MIN_TIMEOUT,
 	DEFAULT_NAME,
+    DEFAULT_OPENMETRICS,
 	DEFAULT_PORT,
+    DEFAULT_REFRESH_WINDOW,
 	DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STATISTICS,
+    DEFAULT_TRANSPORT,
     DEFAULT_TYPE,
 	DOMAIN,
+    FILENAME_PATTERN,
+    MAX_REFRESH_WINDOW,
     MAX_SCAN_INTERVAL,
+    MAX_TIMEOUT,
     MIN_SCAN_INTERVAL,
+    MIN_TIMEOUT,
     SUPPORTED_TYPES,
+    TRANSPORTS,
 )
 
 SCAN_INTERVAL_SCHEMA = vol.All(
@@ -27,6 +47,11 @@ SCAN_INTERVAL_SCHEMA = vol.All(
     vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
 )
 
+TIMEOUT_SCHEMA = vol.All(
+    vol.Coerce(float),
+    vol.Range(min=MIN_TIMEOUT, max=MAX_TIMEOUT),
+)
+
 DATA_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
@@ -65,6 +90,12 @@ class IammeterModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
     _serial_number = ""
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for this handler."""
+        return IammeterModbusOptionsFlow()
+
     def _host_in_configuration_exists(self, host) -> bool:
         """Return True if host exists in configuration."""
         if host in iammeter_modbus_entries(self.hass):
@@ -177,3 +208,76 @@ class IammeterModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class IammeterModbusOptionsFlow(config_entries.OptionsFlow):
+    """Iammeter Modbus options flow."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the IAMMETER options."""
+        errors = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_TIMEOUT] > user_input[CONF_MAX_TIMEOUT]:
+                errors[CONF_MIN_TIMEOUT] = "invalid_timeout_range"
+            transport_file = user_input.get(CONF_TRANSPORT_FILE)
+            if transport_file and not re.match(FILENAME_PATTERN, transport_file):
+                errors[CONF_TRANSPORT_FILE] = "invalid_transport_file"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self.config_entry.options
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_STATISTICS,
+                        default=options.get(
+                            CONF_STATISTICS, DEFAULT_STATISTICS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_ARCHIVE,
+                        default=options.get(CONF_ARCHIVE, DEFAULT_ARCHIVE),
+                    ): bool,
+                    vol.Required(
+                        CONF_OPENMETRICS,
+                        default=options.get(
+                            CONF_OPENMETRICS, DEFAULT_OPENMETRICS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_REFRESH_WINDOW,
+                        default=options.get(
+                            CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_REFRESH_WINDOW),
+                    ),
+                    vol.Required(
+                        CONF_MIN_TIMEOUT,
+                        default=options.get(
+                            CONF_MIN_TIMEOUT, DEFAULT_MIN_TIMEOUT
+                        ),
+                    ): TIMEOUT_SCHEMA,
+                    vol.Required(
+                        CONF_MAX_TIMEOUT,
+                        default=options.get(
+                            CONF_MAX_TIMEOUT, DEFAULT_MAX_TIMEOUT
+                        ),
+                    ): TIMEOUT_SCHEMA,
+                    vol.Required(
+                        CONF_TRANSPORT,
+                        default=options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+                    ): vol.In(TRANSPORTS),
+                    vol.Optional(
+                        CONF_TRANSPORT_FILE,
+                        default=options.get(CONF_TRANSPORT_FILE, ""),
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
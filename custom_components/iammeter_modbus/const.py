@@ -42,16 +42,66 @@ MAX_OFFLINE_RETRY_INTERVAL = 60
 DEFAULT_PORT = 502
 DEFAULT_TYPE = TYPE_3080T
 CONF_IamMeter_HUB = "iammeter_hub"
+CONF_STATISTICS = "statistics"
+DEFAULT_STATISTICS = False
+STATISTICS_STATE_INTERVAL = 300
+CONF_ARCHIVE = "archive"
+DEFAULT_ARCHIVE = False
+CONF_OPENMETRICS = "openmetrics"
+DEFAULT_OPENMETRICS = False
+OPENMETRICS_URL = "/api/iammeter_modbus/metrics"
+CONF_REFRESH_WINDOW = "refresh_window"
+DEFAULT_REFRESH_WINDOW = 0
+MAX_REFRESH_WINDOW = 60000
+CONF_MIN_TIMEOUT = "min_timeout"
+CONF_MAX_TIMEOUT = "max_timeout"
+# Request timeouts in seconds; DEFAULT_TIMEOUT applies until RTTs are measured.
+DEFAULT_TIMEOUT = 2
+DEFAULT_MIN_TIMEOUT = 0.5
+DEFAULT_MAX_TIMEOUT = 5
+MIN_TIMEOUT = 0.1
+MAX_TIMEOUT = 30
+CONF_TRANSPORT = "transport"
+CONF_TRANSPORT_FILE = "transport_file"
+TRANSPORT_LIVE = "live"
+TRANSPORT_RECORD = "record"
+TRANSPORT_REPLAY = "replay"
+TRANSPORT_REPLAY_FAST = "replay_fast"
+TRANSPORTS = (
+    TRANSPORT_LIVE,
+    TRANSPORT_RECORD,
+    TRANSPORT_REPLAY,
+    TRANSPORT_REPLAY_FAST,
+)
+DEFAULT_TRANSPORT = TRANSPORT_LIVE
+# Minimum seconds between state writes; 0 publishes every poll.
+PUBLISH_INTERVAL_FAST = 0
+PUBLISH_INTERVAL_MEDIUM = 10
+PUBLISH_INTERVAL_SLOW = 60
+PUBLISH_INTERVAL_RUNTIME = 300
 ATTR_MANUFACTURER = "IAMMETER"
+ATTR_DURATION = "duration"
+ATTR_FILENAME = "filename"
+# File names accepted below the integration's configuration folder.
+FILENAME_PATTERN = r"^[\w-][\w.-]*$"
+SERVICE_CAPTURE = "capture"
+SERVICE_PROFILE = "profile"
+DEFAULT_CAPTURE_DURATION = 10
+MAX_CAPTURE_DURATION = 60
+DEFAULT_PROFILE_DURATION = 60
+MAX_PROFILE_DURATION = 3600
 
 @dataclass
 class IamMeterModbusSensorEntityDescription(SensorEntityDescription):
     """A class that describes IamMeter Modbus sensor entities."""
 
+    publish_interval: int = PUBLISH_INTERVAL_FAST
+
 SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
     "voltage_a": IamMeterModbusSensorEntityDescription(
     	name="Voltage A",
     	key="voltage_a",
+    	publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -73,6 +123,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"import_energy_a": IamMeterModbusSensorEntityDescription(
 		name="Import Energy A",
 		key="import_energy_a",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -80,6 +131,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"export_energy_a": IamMeterModbusSensorEntityDescription(
 		name="Export Energy A",
 		key="export_energy_a",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -87,6 +139,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"power_factor_a": IamMeterModbusSensorEntityDescription(
 		name="Power Factor A",
 		key="power_factor_a",
+		publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=None,
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -94,6 +147,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"voltage_b": IamMeterModbusSensorEntityDescription(
     	name="Voltage B",
     	key="voltage_b",
+    	publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -115,6 +169,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"import_energy_b": IamMeterModbusSensorEntityDescription(
 		name="Import Energy B",
 		key="import_energy_b",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -122,6 +177,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"export_energy_b": IamMeterModbusSensorEntityDescription(
 		name="Export Energy B",
 		key="export_energy_b",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -129,6 +185,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"power_factor_b": IamMeterModbusSensorEntityDescription(
 		name="Power Factor B",
 		key="power_factor_b",
+		publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=None,
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -137,6 +194,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"voltage_c": IamMeterModbusSensorEntityDescription(
     	name="Voltage C",
     	key="voltage_c",
+    	publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -158,6 +216,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"import_energy_c": IamMeterModbusSensorEntityDescription(
 		name="Import Energy C",
 		key="import_energy_c",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -165,6 +224,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"export_energy_c": IamMeterModbusSensorEntityDescription(
 		name="Export Energy C",
 		key="export_energy_c",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -172,6 +232,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"power_factor_c": IamMeterModbusSensorEntityDescription(
 		name="Power Factor C",
 		key="power_factor_c",
+		publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=None,
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -179,6 +240,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"frequency": IamMeterModbusSensorEntityDescription(
     	name="Frequency",
     	key="frequency",
+    	publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=UnitOfFrequency.HERTZ,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.FREQUENCY,
@@ -193,6 +255,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"total_import_energy": IamMeterModbusSensorEntityDescription(
 		name="Total Import Energy",
 		key="total_import_energy",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -200,6 +263,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"total_export_energy": IamMeterModbusSensorEntityDescription(
 		name="Total Export Energy",
 		key="total_export_energy",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -228,6 +292,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"inductive_kvarh_a": IamMeterModbusSensorEntityDescription(
 		name="Inductive KVARH A",
 		key="inductive_kvarh_a",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfReactiveEnergy.KILO_VOLT_AMPERE_REACTIVE_HOUR,
         device_class=SensorDeviceClass.REACTIVE_ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -235,6 +300,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"capacitive_kvarh_a": IamMeterModbusSensorEntityDescription(
 		name="Capacitive KVARH A",
 		key="capacitive_kvarh_a",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfReactiveEnergy.KILO_VOLT_AMPERE_REACTIVE_HOUR,
         device_class=SensorDeviceClass.REACTIVE_ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -242,6 +308,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"inductive_kvarh_b": IamMeterModbusSensorEntityDescription(
 		name="Inductive KVARH B",
 		key="inductive_kvarh_b",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfReactiveEnergy.KILO_VOLT_AMPERE_REACTIVE_HOUR,
         device_class=SensorDeviceClass.REACTIVE_ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -249,6 +316,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"capacitive_kvarh_b": IamMeterModbusSensorEntityDescription(
 		name="Capacitive KVARH B",
 		key="capacitive_kvarh_b",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfReactiveEnergy.KILO_VOLT_AMPERE_REACTIVE_HOUR,
         device_class=SensorDeviceClass.REACTIVE_ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -256,6 +324,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"inductive_kvarh_c": IamMeterModbusSensorEntityDescription(
 		name="Inductive KVARH C",
 		key="inductive_kvarh_c",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfReactiveEnergy.KILO_VOLT_AMPERE_REACTIVE_HOUR,
         device_class=SensorDeviceClass.REACTIVE_ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -263,6 +332,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"capacitive_kvarh_c": IamMeterModbusSensorEntityDescription(
 		name="Capacitive KVARH C",
 		key="capacitive_kvarh_c",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfReactiveEnergy.KILO_VOLT_AMPERE_REACTIVE_HOUR,
         device_class=SensorDeviceClass.REACTIVE_ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -270,6 +340,7 @@ SENSOR_TYPES: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"runtime": IamMeterModbusSensorEntityDescription(
 		name="Runtime",
 		key="runtime",
+		publish_interval=PUBLISH_INTERVAL_RUNTIME,
 		native_unit_of_measurement=UnitOfTime.SECONDS,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -280,6 +351,7 @@ SENSOR_TYPES_3080: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
     "voltage_a": IamMeterModbusSensorEntityDescription(
     	name="Voltage",
     	key="voltage_a",
+    	publish_interval=PUBLISH_INTERVAL_MEDIUM,
     	native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -301,6 +373,7 @@ SENSOR_TYPES_3080: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"import_energy_a": IamMeterModbusSensorEntityDescription(
 		name="Import Energy",
 		key="import_energy_a",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -308,6 +381,7 @@ SENSOR_TYPES_3080: dict[str, list[IamMeterModbusSensorEntityDescription]] = {
 	"export_energy_a": IamMeterModbusSensorEntityDescription(
 		name="Export Energy",
 		key="export_energy_a",
+		publish_interval=PUBLISH_INTERVAL_SLOW,
 		native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -327,3 +401,108 @@ SENSOR_TYPES_BY_MODEL = {
     TYPE_3046T: SENSOR_TYPES,
     TYPE_2067: SENSOR_TYPES_2067,
 }
+
+REGISTER_U16 = "u16"
+REGISTER_S32 = "s32"
+REGISTER_U32 = "u32"
+
+
+@dataclass(frozen=True)
+class IamMeterRegisterField:
+    """Describe how one value is decoded from the holding registers."""
+
+    key: str
+    address: int
+    kind: str
+    scale: float = 1
+    digits: int | None = None
+
+
+REGISTER_MAP_3080 = (
+    IamMeterRegisterField("voltage_a", 0, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("current_a", 1, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("power_a", 2, REGISTER_S32),
+    IamMeterRegisterField("import_energy_a", 4, REGISTER_U32, 0.0003125, 3),
+    IamMeterRegisterField("export_energy_a", 6, REGISTER_U32, 0.0003125, 3),
+)
+
+REGISTER_MAP = (
+    IamMeterRegisterField("voltage_a", 0, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("current_a", 1, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("power_a", 2, REGISTER_S32),
+    IamMeterRegisterField("import_energy_a", 4, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("export_energy_a", 6, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("power_factor_a", 8, REGISTER_U16, 0.001, 2),
+    IamMeterRegisterField("voltage_b", 10, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("current_b", 11, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("power_b", 12, REGISTER_S32),
+    IamMeterRegisterField("import_energy_b", 14, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("export_energy_b", 16, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("power_factor_b", 18, REGISTER_U16, 0.001, 2),
+    IamMeterRegisterField("voltage_c", 20, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("current_c", 21, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("power_c", 22, REGISTER_S32),
+    IamMeterRegisterField("import_energy_c", 24, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("export_energy_c", 26, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("power_factor_c", 28, REGISTER_U16, 0.001, 2),
+    IamMeterRegisterField("frequency", 30, REGISTER_U16, 0.01, 1),
+    IamMeterRegisterField("total_power", 32, REGISTER_S32),
+    IamMeterRegisterField("total_import_energy", 34, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("total_export_energy", 36, REGISTER_U32, 0.00125, 2),
+    IamMeterRegisterField("reactive_power_a", 38, REGISTER_S32),
+    IamMeterRegisterField("inductive_kvarh_a", 40, REGISTER_U32, 0.001, 3),
+    IamMeterRegisterField("capacitive_kvarh_a", 42, REGISTER_U32, 0.001, 3),
+    IamMeterRegisterField("reactive_power_b", 44, REGISTER_S32),
+    IamMeterRegisterField("inductive_kvarh_b", 46, REGISTER_U32, 0.001, 3),
+    IamMeterRegisterField("capacitive_kvarh_b", 48, REGISTER_U32, 0.001, 3),
+    IamMeterRegisterField("reactive_power_c", 50, REGISTER_S32),
+    IamMeterRegisterField("inductive_kvarh_c", 52, REGISTER_U32, 0.001, 3),
+    IamMeterRegisterField("capacitive_kvarh_c", 54, REGISTER_U32, 0.001, 3),
+    IamMeterRegisterField("runtime", 64, REGISTER_U32),
+)
+
+REGISTER_MAP_2067 = tuple(
+    field for field in REGISTER_MAP if not field.key.endswith("_c")
+)
+
+@dataclass(frozen=True)
+class IamMeterRegisterBlock:
+    """A range of holding registers read in one Modbus transaction."""
+
+    address: int
+    count: int
+    # Read on every Nth poll; cached values are used in between.
+    period: int = 1
+
+
+SLOW_BLOCK_PERIOD = 10
+
+REGISTER_BLOCKS_3080 = (IamMeterRegisterBlock(0, 8),)
+
+# Power factor and the kvarh counters are interleaved with power and
+# reactive power, so only runtime can be split off without extra requests.
+REGISTER_BLOCKS = (
+    IamMeterRegisterBlock(0, 56),
+    IamMeterRegisterBlock(64, 2, SLOW_BLOCK_PERIOD),
+)
+
+REGISTER_BLOCKS_2067 = (
+    IamMeterRegisterBlock(0, 50),
+    IamMeterRegisterBlock(64, 2, SLOW_BLOCK_PERIOD),
+)
+
+REGISTER_BLOCKS_BY_MODEL = {
+    TYPE_3080: REGISTER_BLOCKS_3080,
+    TYPE_3080T: REGISTER_BLOCKS,
+    TYPE_3050T: REGISTER_BLOCKS,
+    TYPE_3046T: REGISTER_BLOCKS,
+    TYPE_2067: REGISTER_BLOCKS_2067,
+}
+
+REGISTER_MAP_BY_MODEL = {
+    TYPE_3080: REGISTER_MAP_3080,
+    TYPE_3080T: REGISTER_MAP,
+    TYPE_3050T: REGISTER_MAP,
+    TYPE_3046T: REGISTER_MAP,
+    TYPE_2067: REGISTER_MAP_2067,
+}
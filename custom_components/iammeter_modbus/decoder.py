@@ -0,0 +1,40 @@
+"""Decode IAMMETER holding registers into snapshots."""
+from typing import NamedTuple
+
+from .const import REGISTER_S32, REGISTER_U16
+
+
+class IamMeterSnapshot(NamedTuple):
+    """Immutable readings decoded from one poll.
+
+    ``values`` is ordered like the model's register map and ``field_index``
+    maps each sensor key to its position, so entities can bind to a position
+    once instead of looking up keys on every state write.
+    """
+
+    values: tuple
+    timestamp: float
+    field_index: dict
+
+
+def build_field_index(fields):
+    """Return the key to position mapping of a register map."""
+    return {field.key: position for position, field in enumerate(fields)}
+
+
+def decode_registers(fields, regs):
+    """Decode one register block into a tuple ordered like ``fields``."""
+    values = []
+    for field in fields:
+        address = field.address
+        if field.kind == REGISTER_U16:
+            value = regs[address] & 0xFFFF
+        else:
+            value = (regs[address] << 16) | regs[address + 1]
+            if field.kind == REGISTER_S32 and value & 0x80000000:
+                value -= 0x100000000
+        if field.digits is not None:
+            value = round(value * field.scale, field.digits)
+        values.append(value)
+    return tuple(values)
+
@@ -0,0 +1,151 @@
+"""OpenMetrics endpoint for IAMMETER meters."""
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+
+from .const import (
+    DOMAIN,
+    OPENMETRICS_URL,
+    REGISTER_BLOCKS_BY_MODEL,
+    REGISTER_MAP_BY_MODEL,
+)
+
+CONTENT_TYPE_OPENMETRICS = (
+    "application/openmetrics-text; version=1.0.0; charset=utf-8"
+)
+PREFIX = "iammeter_modbus_"
+
+FIELD_FAMILIES = list(
+    dict.fromkeys(
+        field.key for fields in REGISTER_MAP_BY_MODEL.values() for field in fields
+    )
+)
+_FIELD_FAMILY_INDEX = {key: index for index, key in enumerate(FIELD_FAMILIES)}
+
+# (family, type, sample suffix, help)
+METER_FAMILIES = (
+    ("up", "gauge", "", "1 if the last poll succeeded"),
+    (
+        "last_update_timestamp_seconds",
+        "gauge",
+        "",
+        "Time of the last successful read",
+    ),
+    ("poll_duration_seconds", "gauge", "", "Duration of the last poll"),
+    ("polls", "counter", "_total", "Polls started"),
+    ("poll_errors", "counter", "_total", "Polls that failed"),
+    (
+        "unchanged_polls",
+        "counter",
+        "_total",
+        "Polls skipped because no register changed",
+    ),
+    ("request_timeout_seconds", "gauge", "", "Current Modbus request timeout"),
+)
+
+BLOCK_AGE_FAMILY = "register_block_age_seconds"
+
+HEADERS = [
+    f"# TYPE {PREFIX}{key} gauge\n# HELP {PREFIX}{key} IAMMETER {key} reading"
+    for key in FIELD_FAMILIES
+] + [
+    f"# TYPE {PREFIX}{family} {kind}\n# HELP {PREFIX}{family} {help_text}"
+    for family, kind, _, help_text in METER_FAMILIES
+] + [
+    f"# TYPE {PREFIX}{BLOCK_AGE_FAMILY} gauge\n"
+    f"# HELP {PREFIX}{BLOCK_AGE_FAMILY} Seconds since a register block was read"
+]
+
+
+def _escape(value):
+    return (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+class IamMeterMetrics:
+    """Pre-built sample prefixes of one meter."""
+
+    def __init__(self, name, model):
+        """Build the label strings once per meter."""
+        label_pairs = f'meter="{_escape(name)}",model="{_escape(model)}"'
+        labels = f"{{{label_pairs}}} "
+        self.field_samples = [
+            (_FIELD_FAMILY_INDEX[field.key], f"{PREFIX}{field.key}{labels}", position)
+            for position, field in enumerate(REGISTER_MAP_BY_MODEL[model])
+        ]
+        self.meter_samples = [
+            f"{PREFIX}{family}{suffix}{labels}"
+            for family, _, suffix, _ in METER_FAMILIES
+        ]
+        self.block_samples = {
+            block.address: (
+                f"{PREFIX}{BLOCK_AGE_FAMILY}"
+                f'{{{label_pairs},block="{block.address}"}} '
+            )
+            for block in REGISTER_BLOCKS_BY_MODEL[model]
+        }
+
+
+def render_metrics(coordinators):
+    """Render the cached readings of ``coordinators`` as OpenMetrics text."""
+    families = [[] for _ in HEADERS]
+    meter_offset = len(FIELD_FAMILIES)
+    block_ages = families[-1]
+    for coordinator in coordinators:
+        metrics = coordinator.metrics
+        data = coordinator.data
+        if data is not None:
+            values = data.values
+            for family, prefix, position in metrics.field_samples:
+                families[family].append(f"{prefix}{values[position]}")
+
+        hub = coordinator.my_api
+        meter_values = (
+            1 if coordinator.last_update_success else 0,
+            hub.read_at,
+            coordinator.poll_duration,
+            coordinator.polls,
+            coordinator.poll_errors,
+            hub.unchanged_polls,
+            hub.timeout,
+        )
+        for index, (prefix, value) in enumerate(
+            zip(metrics.meter_samples, meter_values)
+        ):
+            if value is not None:
+                families[meter_offset + index].append(f"{prefix}{value}")
+        for address, age in hub.block_ages().items():
+            if age is not None:
+                block_ages.append(f"{metrics.block_samples[address]}{age}")
+
+    lines = []
+    for header, samples in zip(HEADERS, families):
+        if samples:
+            lines.append(header)
+            lines.extend(samples)
+    lines.append("# EOF\n")
+    return "\n".join(lines)
+
+
+class IamMeterOpenMetricsView(HomeAssistantView):
+    """Serve the latest readings of all meters with metrics enabled."""
+
+    url = OPENMETRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self, hass):
+        """Initialize the view."""
+        self._hass = hass
+
+    async def get(self, request):
+        """Render the cached data; never triggers a Modbus read."""
+        coordinators = [
+            coordinator
+            for coordinator in self._hass.data[DOMAIN].values()
+            if coordinator.metrics is not None
+        ]
+        return web.Response(
+            body=render_metrics(coordinators).encode(),
+            headers={"Content-Type": CONTENT_TYPE_OPENMETRICS},
+        )
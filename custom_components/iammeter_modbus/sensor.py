@@ -1,7 +1,9 @@
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_TYPE
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 import logging
-from typing import Optional, Dict, Any
+import time
 
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -11,8 +13,11 @@ from . import IamMeterModbusData
 
 from .const import (
     ATTR_MANUFACTURER,
+    CONF_STATISTICS,
+    DEFAULT_STATISTICS,
     DOMAIN,
     SENSOR_TYPES_BY_MODEL,
+    STATISTICS_STATE_INTERVAL,
     IamMeterModbusSensorEntityDescription,
 )
 
@@ -25,6 +30,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     host = entry.data[CONF_HOST]
     device_type = entry.data[CONF_TYPE]
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    statistics = entry.options.get(CONF_STATISTICS, DEFAULT_STATISTICS)
     device_info = {
         "identifiers": {(DOMAIN, hub_name)},
         "name": hub_name,
@@ -40,6 +46,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
             hub_name,
             device_info,
             sensor_description,
+            statistics,
         )
         entities.append(sensor)
 
@@ -56,28 +63,89 @@ class IamMeterModbusSensor(CoordinatorEntity, SensorEntity):
         platform_name,
         device_info,
         description: IamMeterModbusSensorEntityDescription,
+        statistics=False,
     ):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._platform_name = platform_name
         self._attr_device_info = device_info
         self.entity_description: IamMeterModbusSensorEntityDescription = description
-
-    @property
-    def name(self):
-        """Return the name."""
-        return f"{self._platform_name} {self.entity_description.name}"
-
-    @property
-    def unique_id(self) -> Optional[str]:
-        return f"{self._platform_name}_{self.entity_description.key}"
+        self._attr_name = f"{platform_name} {description.name}"
+        self._attr_unique_id = f"{platform_name}_{description.key}"
+        self._position = coordinator.my_api.field_index[description.key]
+        self._publish_interval = description.publish_interval
+        if statistics:
+            # The integration writes long-term statistics itself, so the
+            # recorder must not compile them again from throttled states.
+            self._attr_state_class = None
+            self._publish_interval = max(
+                self._publish_interval, STATISTICS_STATE_INTERVAL
+            )
+        self._last_publish = None
+        self._last_available = None
+        self._cancel_trailing_publish = None
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if(self.coordinator.data):
-            return (
-                self.coordinator.data.get(
-                    self.entity_description.key, None
+        data = self.coordinator.data
+        if data is not None:
+            return data.values[self._position]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        profiler = self.coordinator.profiler
+        if profiler is not None:
+            profiler.runcall(self._async_publish_state)
+        else:
+            self._async_publish_state()
+
+    @callback
+    def _async_publish_state(self) -> None:
+        """Write state at most once per publish interval.
+
+        An update inside the interval schedules one trailing write at its
+        end, so the latest value is published even if no update follows.
+        """
+        now = time.monotonic()
+        available = self.available
+        if (
+            available == self._last_available
+            and self._last_publish is not None
+            and now - self._last_publish < self._publish_interval
+        ):
+            if self._cancel_trailing_publish is None:
+                self._cancel_trailing_publish = async_call_later(
+                    self.hass,
+                    self._publish_interval - (now - self._last_publish),
+                    self._async_trailing_publish,
                 )
-            )
+            return
+        self._async_write_published_state(now, available)
+
+    @callback
+    def _async_trailing_publish(self, _now) -> None:
+        """Write the state suppressed during the last publish interval."""
+        self._cancel_trailing_publish = None
+        self._async_write_published_state(time.monotonic(), self.available)
+
+    @callback
+    def _async_write_published_state(self, now, available) -> None:
+        """Write state and restart the publish interval."""
+        self._async_cancel_trailing_publish()
+        self._last_available = available
+        self._last_publish = now
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_trailing_publish(self) -> None:
+        """Cancel a scheduled trailing write."""
+        if self._cancel_trailing_publish is not None:
+            self._cancel_trailing_publish()
+            self._cancel_trailing_publish = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a scheduled trailing write."""
+        self._async_cancel_trailing_publish()
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,189 @@
+"""Long-term statistics aggregation for IAMMETER meters."""
+import logging
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+from homeassistant.util import slugify
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant < 2025.6
+    StatisticMeanType = None
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class IamMeterStatistics:
+    """Aggregate polled readings into hourly long-term statistics.
+
+    Measurement sensors are reduced to mean/min/max per hour. Energy counters
+    keep their last reading as state. Their sum starts at 0 and adds every
+    increase between readings; a drop is a counter reset and adds the new
+    reading, like a ``total_increasing`` sensor. The running sums are kept
+    in entry storage so they continue across reloads and restarts.
+
+    A row is written once per hour. The bucket of an unfinished hour is saved
+    on shutdown and resumed on the next setup, since writing it early would
+    let the rest of the hour overwrite the row with a partial aggregate.
+    """
+
+    def __init__(self, hass, hub_name, descriptions, field_index, entry_id):
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.statistics.{entry_id}"
+        )
+        self._metadata = {}
+        for description in descriptions:
+            if description.state_class is None:
+                continue
+            position = field_index[description.key]
+            has_sum = description.state_class == SensorStateClass.TOTAL_INCREASING
+            metadata = StatisticMetaData(
+                has_sum=has_sum,
+                name=f"{hub_name} {description.name}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{slugify(f'{hub_name}_{description.key}')}",
+                unit_of_measurement=description.native_unit_of_measurement,
+            )
+            if StatisticMeanType is None:
+                metadata["has_mean"] = not has_sum
+            else:
+                metadata["mean_type"] = (
+                    StatisticMeanType.NONE
+                    if has_sum
+                    else StatisticMeanType.ARITHMETIC
+                )
+            self._metadata[position] = metadata
+        self._sum_positions = frozenset(
+            position
+            for position, metadata in self._metadata.items()
+            if metadata["has_sum"]
+        )
+        self._bucket_start = None
+        # snapshot position -> [count, total, min, max, last]
+        self._buckets = {}
+        # snapshot position -> [sum, last reading]
+        self._sums = {}
+
+    @callback
+    def async_add(self, snapshot):
+        """Add one poll's readings to the current hourly bucket."""
+        start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if start != self._bucket_start:
+            self.async_flush()
+            self._bucket_start = start
+
+        values = snapshot.values
+        for position in self._metadata:
+            value = values[position]
+            bucket = self._buckets.get(position)
+            if bucket is None:
+                self._buckets[position] = [1, value, value, value, value]
+                continue
+            bucket[0] += 1
+            bucket[1] += value
+            if value < bucket[2]:
+                bucket[2] = value
+            if value > bucket[3]:
+                bucket[3] = value
+            bucket[4] = value
+        for position in self._sum_positions:
+            self._async_add_increase(position, values[position])
+
+    @callback
+    def _async_add_increase(self, position, value):
+        """Add the increase since the previous reading to a running sum."""
+        counter = self._sums.get(position)
+        if counter is None:
+            # Count from here, not from the meter's lifetime reading.
+            self._sums[position] = [0, value]
+            return
+        previous = counter[1]
+        # A drop is a counter reset or meter swap: count the new reading.
+        counter[0] += value - previous if value >= previous else value
+        counter[1] = value
+
+    async def async_restore(self):
+        """Resume the running sums and bucket saved by :meth:`async_save`."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self._sums = {
+            position: counter
+            for position, *counter in stored.get("sums", [])
+            if position in self._sum_positions
+        }
+        if stored.get("start") is None:
+            return
+        self._bucket_start = dt_util.parse_datetime(stored["start"])
+        self._buckets = {
+            position: bucket
+            for position, *bucket in stored["buckets"]
+            if position in self._metadata
+        }
+        for position in self._sum_positions & self._buckets.keys():
+            self._sums.setdefault(position, [0, self._buckets[position][4]])
+        start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if self._bucket_start != start:
+            # The saved hour is over; nothing else will be added to it.
+            self.async_flush()
+
+    async def async_save(self):
+        """Save the running sums and current bucket for the next setup."""
+        start = None
+        if self._bucket_start is not None and self._buckets:
+            start = self._bucket_start.isoformat()
+        await self._store.async_save(
+            {
+                "start": start,
+                "buckets": [
+                    [position, *bucket]
+                    for position, bucket in self._buckets.items()
+                ],
+                "sums": [
+                    [position, *counter]
+                    for position, counter in self._sums.items()
+                ],
+            }
+        )
+
+    @callback
+    def async_flush(self):
+        """Write the current bucket to the recorder and start a new one."""
+        if self._bucket_start is None or not self._buckets:
+            return
+
+        _LOGGER.debug(
+            "Writing %s statistics for %s", len(self._buckets), self._bucket_start
+        )
+        for position, (count, total, minimum, maximum, last) in self._buckets.items():
+            metadata = self._metadata[position]
+            if metadata["has_sum"]:
+                statistic = StatisticData(
+                    start=self._bucket_start,
+                    state=last,
+                    sum=self._sums[position][0],
+                )
+            else:
+                statistic = StatisticData(
+                    start=self._bucket_start,
+                    mean=total / count,
+                    min=minimum,
+                    max=maximum,
+                )
+            async_add_external_statistics(self._hass, metadata, [statistic])
+        self._buckets = {}
@@ -0,0 +1,242 @@
+"""Record and replay transports for the IAMMETER Modbus hub.
+
+A recording is a small header followed by one binary record per request:
+request time (Unix timestamp, float64), round-trip time (float32), status
+(uint8), requested address and count (uint16 each), returned register count
+(uint16) and the registers (uint16 each). Timeouts, error responses, failed
+connects and short responses are all kept, so a replay reproduces the exact
+traffic the hub saw.
+"""
+import asyncio
+import logging
+import os
+import struct
+import time
+
+from pymodbus.exceptions import ConnectionException, ModbusException
+
+from .archive import WRITER
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_HEADER = b"IMRR\x02"
+RECORD = struct.Struct("<dfBHHH")
+STATUS_OK = 0
+STATUS_ERROR = 1
+STATUS_TIMEOUT = 2
+STATUS_DISCONNECTED = 3
+# Flush the recording buffer once it holds this many bytes or seconds.
+FLUSH_SIZE = 64 * 1024
+FLUSH_INTERVAL = 60
+
+
+def read_recording(path):
+    """Return the records of a recording.
+
+    Each record is ``(time, rtt, status, address, count, registers)``.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(RECORDING_HEADER):
+        raise ValueError(f"{path} is not an IAMMETER Modbus recording")
+
+    records = []
+    offset = len(RECORDING_HEADER)
+    while offset + RECORD.size <= len(data):
+        timestamp, rtt, status, address, count, size = RECORD.unpack_from(
+            data, offset
+        )
+        offset += RECORD.size
+        registers = struct.unpack_from(f"<{size}H", data, offset)
+        offset += 2 * size
+        records.append((timestamp, rtt, status, address, count, registers))
+    return records
+
+
+class RecordingModbusClient:
+    """Pass requests to a Modbus client and record every response."""
+
+    def __init__(self, client, path):
+        """Initialize the recorder."""
+        self._client = client
+        self._path = path
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+
+    @property
+    def connected(self):
+        """Return True if the wrapped client is connected."""
+        return self._client.connected
+
+    async def connect(self):
+        """Connect the wrapped client, recording a failed attempt."""
+        started = time.time()
+        connected = await self._client.connect()
+        if not connected:
+            self._record(
+                started, time.time() - started, STATUS_DISCONNECTED, 0, 0, ()
+            )
+        return connected
+
+    async def read_holding_registers(self, **kwargs):
+        """Read holding registers and record the outcome."""
+        request = (kwargs["address"], kwargs["count"])
+        started = time.time()
+        try:
+            resp = await self._client.read_holding_registers(**kwargs)
+        except TypeError:
+            # Keyword fallback between pymodbus releases, not a response.
+            raise
+        except ConnectionException:
+            self._record(
+                started, time.time() - started, STATUS_DISCONNECTED, *request, ()
+            )
+            raise
+        except (OSError, TimeoutError, ModbusException, asyncio.CancelledError):
+            # The hub's request timeout cancels the read instead of raising
+            # TimeoutError here, so a cancelled read is recorded as a timeout.
+            self._record(
+                started, time.time() - started, STATUS_TIMEOUT, *request, ()
+            )
+            raise
+
+        if resp.isError():
+            self._record(started, time.time() - started, STATUS_ERROR, *request, ())
+        else:
+            self._record(
+                started, time.time() - started, STATUS_OK, *request, resp.registers
+            )
+        return resp
+
+    def close(self):
+        """Close the wrapped client and flush pending records."""
+        self._client.close()
+        self._flush()
+
+    def _record(self, timestamp, rtt, status, address, count, registers):
+        registers = [register & 0xFFFF for register in registers]
+        self._buffer += RECORD.pack(
+            timestamp, rtt, status, address, count, len(registers)
+        )
+        self._buffer += struct.pack(f"<{len(registers)}H", *registers)
+        if (
+            len(self._buffer) >= FLUSH_SIZE
+            or time.monotonic() - self._last_flush >= FLUSH_INTERVAL
+        ):
+            self._flush()
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        # The shared writer thread keeps the appended chunks in order.
+        WRITER.submit(self._write, chunk)
+
+    def _write(self, chunk):
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(self._path, "ab") as file:
+                if file.tell() == 0:
+                    file.write(RECORDING_HEADER)
+                file.write(chunk)
+        except OSError as err:
+            _LOGGER.error("Unable to write recording %s: %s", self._path, err)
+
+
+class _ReplayResponse:
+    """Minimal stand-in for a pymodbus register response."""
+
+    __slots__ = ("registers", "_error")
+
+    def __init__(self, registers, error):
+        self.registers = list(registers)
+        self._error = error
+
+    def isError(self):
+        """Return True for a recorded Modbus error response."""
+        return self._error
+
+    def __str__(self):
+        return "Recorded Modbus error response" if self._error else "Recorded response"
+
+
+class ReplayModbusClient:
+    """Feed a recording back in place of ``AsyncModbusTcpClient``.
+
+    With ``realtime`` set, responses are released with the recorded spacing
+    and round-trip times; otherwise they are returned as fast as requested.
+    Requests must match the recorded address and count, so a recording made
+    with a different register layout is not replayed misaligned.
+    """
+
+    def __init__(self, path, realtime=True):
+        """Initialize the replay client."""
+        self._path = path
+        self._realtime = realtime
+        self._records = None
+        self._position = 0
+        self._connected = False
+        self._origin = None
+
+    @property
+    def connected(self):
+        """Return True while the replay is connected."""
+        return self._connected
+
+    async def connect(self):
+        """Load the recording and replay a recorded connect failure."""
+        if self._records is None:
+            self._records = await asyncio.get_running_loop().run_in_executor(
+                None, read_recording, self._path
+            )
+        record = self._peek()
+        if record is not None and record[2] == STATUS_DISCONNECTED:
+            self._position += 1
+            await self._wait(record)
+            return False
+        self._connected = record is not None
+        return self._connected
+
+    async def read_holding_registers(self, **kwargs):
+        """Return the next recorded response."""
+        record = self._peek()
+        if not self._connected or record is None:
+            self._connected = False
+            raise ConnectionException("Replay finished")
+        status = record[2]
+        request = (kwargs["address"], kwargs["count"])
+        if status != STATUS_DISCONNECTED and record[3:5] != request:
+            raise ValueError(
+                f"Recorded request for {record[4]} registers at {record[3]} "
+                f"does not match request for {request[1]} at {request[0]}"
+            )
+        self._position += 1
+        await self._wait(record)
+
+        if status == STATUS_TIMEOUT:
+            raise TimeoutError("Recorded timeout")
+        if status == STATUS_DISCONNECTED:
+            self._connected = False
+            raise ConnectionException("Recorded disconnect")
+        return _ReplayResponse(record[5], status == STATUS_ERROR)
+
+    def close(self):
+        """Disconnect the replay."""
+        self._connected = False
+
+    def _peek(self):
+        if self._records is None or self._position >= len(self._records):
+            return None
+        return self._records[self._position]
+
+    async def _wait(self, record):
+        if not self._realtime:
+            return
+        loop = asyncio.get_running_loop()
+        if self._origin is None:
+            self._origin = loop.time() - record[0]
+        delay = self._origin + record[0] + record[1] - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)